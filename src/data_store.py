@@ -46,6 +46,8 @@ class DataStore(GObject.GObject):
 
         self.sqlite = SQLiteStore(app_id=APP_ID)
 
+        self._changed_pending = False
+        self._storage_version: Optional[int] = None
         if self._get_storage_version() != 3:
             self._set_storage_version(3)
 
@@ -68,17 +70,27 @@ class DataStore(GObject.GObject):
     def add_cycle(self, cycle: Cycle) -> None:
         """Add a new cycle and update all links."""
         self.sqlite.insert_cycle(cycle)
-        self.emit("changed")
+        self._schedule_changed()
+
+    def add_cycles(self, cycles: List[Cycle]) -> None:
+        """Add several cycles at once, emitting a single change."""
+        self.sqlite.insert_cycles(cycles)
+        self._schedule_changed()
 
     def update_cycle(self, cycle: Cycle) -> None:
         """Update an existing cycle and update all links."""
         self.sqlite.update_cycle(cycle)
-        self.emit("changed")
+        self._schedule_changed()
+
+    def update_cycles(self, cycles: List[Cycle]) -> None:
+        """Update several cycles at once, emitting a single change."""
+        self.sqlite.update_cycles(cycles)
+        self._schedule_changed()
 
     def delete_cycle(self, cycle: Cycle) -> None:
         """Delete a cycle and update all links."""
         self.sqlite.delete_cycle(cycle)
-        self.emit("changed")
+        self._schedule_changed()
 
     def get_pregnancies(self) -> List[Pregnancy]:
         """Return all stored pregnancies."""
@@ -94,17 +106,22 @@ class DataStore(GObject.GObject):
     def add_pregnancy(self, pregnancy: Pregnancy) -> None:
         """Add a new pregnancy and link it to the appropriate cycle."""
         self.sqlite.insert_pregnancy(pregnancy)
-        self.emit("changed")
+        self._schedule_changed()
+
+    def add_pregnancies(self, pregnancies: List[Pregnancy]) -> None:
+        """Add several pregnancies at once, emitting a single change."""
+        self.sqlite.insert_pregnancies(pregnancies)
+        self._schedule_changed()
 
     def update_pregnancy(self, pregnancy: Pregnancy) -> None:
         """Update an existing pregnancy and update all links."""
-        self.sqlite.update_pregnancy(pregnancy)
-        self.emit("changed")
+        if self.sqlite.update_pregnancy(pregnancy):
+            self._schedule_changed()
 
     def delete_pregnancy(self, pregnancy: Pregnancy) -> None:
         """Delete a pregnancy and update all links."""
         self.sqlite.delete_pregnancy(pregnancy)
-        self.emit("changed")
+        self._schedule_changed()
 
     def save_all(self) -> None:
         """No-op: SQLite writes are immediate."""
@@ -114,14 +131,32 @@ class DataStore(GObject.GObject):
         """Reload data from SQLite."""
         pass
 
+    def _schedule_changed(self) -> None:
+        """Emit "changed" once the main loop is idle, coalescing bursts."""
+        if self._changed_pending:
+            return
+        self._changed_pending = True
+        GLib.idle_add(self._flush_changed)
+
+    def _flush_changed(self) -> bool:
+        self._changed_pending = False
+        self.emit("changed")
+        return GLib.SOURCE_REMOVE
+
     def _metadata_path(self) -> Path:
         return self.data_dir / "metadata.json"
 
     def _get_storage_version(self) -> int:
-        path = self._metadata_path()
-        if not path.exists():
-            return 1
-        return json.loads(path.read_text()).get("storage_version", 1)
+        if self._storage_version is None:
+            try:
+                data = json.loads(self._metadata_path().read_text())
+            except FileNotFoundError:
+                data = {}
+            self._storage_version = data.get("storage_version", 1)
+        return self._storage_version
 
     def _set_storage_version(self, version: int) -> None:
+        if self._storage_version == version:
+            return
         self._metadata_path().write_text(json.dumps({"storage_version": version}))
+        self._storage_version = version
@@ -23,6 +23,23 @@ from gettext import gettext as _
 
 from gi.repository import Adw, GLib, GObject, Gtk  # type: ignore
 
+# Translated once at import; the text domain is bound before the UI loads
+_FLOW_LABELS = (
+    _("None"),
+    _("Light"),
+    _("Medium"),
+    _("Heavy"),
+)
+
+_MOOD_LABELS = (
+    _("Neutral"),
+    _("Calm"),
+    _("Sad"),
+    _("Irritable"),
+    _("Tired"),
+    _("Sensitive"),
+)
+
 
 @Gtk.Template(resource_path="/io/github/kingorgg/Luna/day_row.ui")
 class DayRow(Adw.ExpanderRow):
@@ -35,8 +52,26 @@ class DayRow(Adw.ExpanderRow):
     symptoms: Adw.EntryRow = Gtk.Template.Child()
     notes: Adw.EntryRow = Gtk.Template.Child()
 
+    # Option models shared by every row, built on first use
+    _FLOW_MODEL = None
+    _FLOW_INDEX = None
+    _MOOD_MODEL = None
+    _MOOD_INDEX = None
+
     def __init__(self, day, **kwargs):
         super().__init__(**kwargs)
+        self.dirty = False
+
+        # Any edit marks the row so saving only reads rows that changed
+        self.flow.connect("notify::selected", self._mark_dirty)
+        self.mood.connect("notify::selected", self._mark_dirty)
+        for entry in (self.temp, self.symptoms, self.notes):
+            entry.connect("changed", self._mark_dirty)
+
+        self.rebind(day)
+
+    def rebind(self, day) -> None:
+        """Show another day in this row, reusing its widgets."""
         self.day = day
         self.set_title(self.day.date.isoformat())
 
@@ -47,35 +82,35 @@ class DayRow(Adw.ExpanderRow):
         self.temp.set_text("" if day.temperature is None else str(day.temperature))
         self.symptoms.set_text(", ".join(day.symptoms))
         self.notes.set_text(day.notes or "")
+        self.dirty = False
+
+    def _mark_dirty(self, *_) -> None:
+        self.dirty = True
+
+    @classmethod
+    def _get_flow_model(cls) -> Gtk.StringList:
+        """Return the flow options model shared by every row."""
+        if cls._FLOW_MODEL is None:
+            cls._FLOW_MODEL = Gtk.StringList.new(list(_FLOW_LABELS))
+            cls._FLOW_INDEX = {label: i for i, label in enumerate(_FLOW_LABELS)}
+        return cls._FLOW_MODEL
+
+    @classmethod
+    def _get_mood_model(cls) -> Gtk.StringList:
+        """Return the mood options model shared by every row."""
+        if cls._MOOD_MODEL is None:
+            cls._MOOD_MODEL = Gtk.StringList.new(list(_MOOD_LABELS))
+            cls._MOOD_INDEX = {label: i for i, label in enumerate(_MOOD_LABELS)}
+        return cls._MOOD_MODEL
 
     def _init_flow(self):
-        options = [
-            _("None"),
-            _("Light"),
-            _("Medium"),
-            _("Heavy"),
-        ]
-        model = Gtk.StringList.new(options)
-        self.flow.set_model(model)
-
-        if self.day.flow in options:
-            self.flow.set_selected(options.index(self.day.flow))
-        else:
-            self.flow.set_selected(0)
+        self.flow.set_model(self._get_flow_model())
+        selected = self._FLOW_INDEX.get(self.day.flow, 0)
+        if self.flow.get_selected() != selected:
+            self.flow.set_selected(selected)
 
     def _init_mood(self):
-        options = [
-            _("Neutral"),
-            _("Calm"),
-            _("Sad"),
-            _("Irritable"),
-            _("Tired"),
-            _("Sensitive"),
-        ]
-        model = Gtk.StringList.new(options)
-        self.mood.set_model(model)
-
-        if self.day.mood in options:
-            self.mood.set_selected(options.index(self.day.mood))
-        else:
-            self.mood.set_selected(0)
+        self.mood.set_model(self._get_mood_model())
+        selected = self._MOOD_INDEX.get(self.day.mood, 0)
+        if self.mood.get_selected() != selected:
+            self.mood.set_selected(selected)
@@ -20,10 +20,12 @@
 
 from __future__ import annotations
 
-import statistics
+import math
 from datetime import date, timedelta
+from functools import cached_property
 from gettext import gettext as _
-from typing import List, Optional
+from itertools import pairwise
+from typing import List, Optional, Tuple
 
 from .models import Cycle
 
@@ -34,48 +36,82 @@ class CycleStats:
     """
 
     def __init__(self, cycles: List[Cycle], cycle_len: int, luteal_len: int) -> None:
-        self.cycles = [c for c in cycles if not c.pregnancy]
+        self._all_cycles = cycles
         self.cycle_len = cycle_len
         self.luteal_len = luteal_len
 
-    @property
+    @cached_property
+    def cycles(self) -> List[Cycle]:
+        """Cycles used for statistics, excluding those linked to a pregnancy."""
+        return [c for c in self._all_cycles if not c.pregnancy]
+
+    @cached_property
+    def _last_cycle(self) -> Optional[Cycle]:
+        """The most recent cycle not linked to a pregnancy."""
+        return next((c for c in reversed(self._all_cycles) if not c.pregnancy), None)
+
+    @cached_property
     def intervals(self) -> List[int]:
         """Calculate the list of cycle lengths in days."""
-        if len(self.cycles) < 2:
-            return []
-        return [
-            (self.cycles[i + 1].start_date - self.cycles[i].start_date).days
-            for i in range(len(self.cycles) - 1)
-        ]
+        starts = [c.start_date.toordinal() for c in self.cycles]
+        return [b - a for a, b in pairwise(starts)]
+
+    @cached_property
+    def _stats(self) -> Optional[Tuple[float, float, int, int]]:
+        """Return (mean, stdev, min, max) of the intervals in a single pass."""
+        if not self.intervals:
+            return None
+
+        # Intervals are whole days, so exact integer sums keep the mean from
+        # drifting below a whole number before callers truncate it
+        n = 0
+        total = 0
+        total_sq = 0
+        lo = hi = self.intervals[0]
+        for x in self.intervals:
+            n += 1
+            total += x
+            total_sq += x * x
+            if x < lo:
+                lo = x
+            elif x > hi:
+                hi = x
+
+        mean = total / n
+        if n > 1:
+            stdev = math.sqrt((n * total_sq - total * total) / (n * (n - 1)))
+        else:
+            stdev = 0.0
+        return mean, stdev, lo, hi
 
     def average_cycle_length(self) -> float:
         """Calculate the average cycle length."""
-        if not self.intervals:
+        if self._stats is None:
             return float(self.cycle_len)
-        return statistics.mean(self.intervals)
+        return self._stats[0]
 
     def cycle_length_std_dev(self) -> float:
         """Calculate the standard deviation of cycle lengths."""
-        if len(self.intervals) < 2:
+        if self._stats is None:
             return 0.0
-        return statistics.stdev(self.intervals)
+        return self._stats[1]
 
     def cycle_length_range(self) -> str:
         """Calculate the min and max cycle lengths."""
-        if not self.intervals:
+        if self._stats is None:
             return "-"
-        return f"{min(self.intervals)}-{max(self.intervals)} days"
+        return f"{self._stats[2]}-{self._stats[3]} days"
 
-    @property
+    @cached_property
     def predicted_next_period(self) -> Optional[date]:
         """Predict the next period start date."""
-        if not self.cycles:
+        last_cycle = self._last_cycle
+        if last_cycle is None:
             return None
-        last_cycle = self.cycles[-1]
         avg_length = self.average_cycle_length() or self.cycle_len
         return last_cycle.start_date + timedelta(days=int(avg_length))
 
-    @property
+    @cached_property
     def predicted_ovulation(self) -> Optional[date]:
         """Predict the next ovulation date."""
         next_period = self.predicted_next_period
@@ -83,13 +119,13 @@ class CycleStats:
             return None
         return next_period - timedelta(days=self.luteal_len)
 
-    def is_ovulating(self) -> bool:
+    def is_ovulating(self, today: Optional[date] = None) -> bool:
         """Check if the user is currently ovulating."""
         ovulation_day = self.predicted_ovulation
         if not ovulation_day:
             return False
 
-        today = date.today()
+        today = today or date.today()
 
         # Define the ovulation window (2 days before and 2 days after)
         ovulation_start = ovulation_day - timedelta(days=2)
@@ -97,14 +133,14 @@ class CycleStats:
 
         return ovulation_start <= today <= ovulation_end
 
-    def get_current_phase(self) -> str:
+    def get_current_phase(self, today: Optional[date] = None) -> str:
         """Determine the current phase of the cycle."""
-        if not self.cycles:
+        last_cycle = self._last_cycle
+        if last_cycle is None:
             # No cycles recorded, phase is unknown
             return _("Unknown")
 
-        today = date.today()
-        last_cycle = self.cycles[-1]
+        today = today or date.today()
         bleeding_days = last_cycle.duration
         avg_length = int(self.average_cycle_length()) or self.cycle_len
         ovulation_day = self.predicted_ovulation
@@ -121,7 +157,7 @@ class CycleStats:
             return _("Menstruation")
         elif ovulation_day and today < ovulation_day - timedelta(days=self.luteal_len):
             return _("Follicular")
-        elif self.is_ovulating():
+        elif self.is_ovulating(today):
             return _("Ovulation")
         else:
             return _("Luteal")
@@ -34,6 +34,11 @@ gi.require_version("Adw", "1")
 
 MAIN_DEVELOPER = "Daniel Taylor"
 
+_COLOR_SCHEMES = {
+    ColorSchemeMode.LIGHT: Adw.ColorScheme.FORCE_LIGHT,
+    ColorSchemeMode.DARK: Adw.ColorScheme.FORCE_DARK,
+}
+
 
 class LunaApplication(Adw.Application):
     """The main application singleton class."""
@@ -45,6 +50,9 @@ class LunaApplication(Adw.Application):
         self.version = version
         self.settings = Gio.Settings.new(self.application_id)
 
+        self._about_dialog: Optional[Adw.AboutDialog] = None
+        self._preferences_dialog: Optional[Adw.PreferencesDialog] = None
+
         from .data_store import DataStore
 
         self.data_store = DataStore()
@@ -67,6 +75,9 @@ class LunaApplication(Adw.Application):
 
     def do_shutdown(self) -> None:
         """Close the SQLite connection."""
+        if self.settings.get_has_unapplied():
+            self.settings.apply()
+
         try:
             if hasattr(self, "data_store") and self.data_store:
                 self.data_store.close()
@@ -88,6 +99,11 @@ class LunaApplication(Adw.Application):
 
     def on_about_action(self, *args: Any) -> None:
         """Callback for the app.about action."""
+        if self._about_dialog is None:
+            self._about_dialog = self._build_about_dialog()
+        self._about_dialog.present(self.props.active_window)
+
+    def _build_about_dialog(self) -> Adw.AboutDialog:
         about = Adw.AboutDialog(
             application_name="luna",
             application_icon=self.application_id,
@@ -107,12 +123,23 @@ class LunaApplication(Adw.Application):
 
         about.set_translator_credits(_("translator-credits"))
         about.set_artists([MAIN_DEVELOPER])
-        about.present(self.props.active_window)
+        return about
 
     def on_preferences_action(self, *args: Any) -> None:
         """Callback for the app.preferences action."""
+        if self._preferences_dialog is None:
+            self._preferences_dialog = self._build_preferences_dialog()
+        self._preferences_dialog.present(self.props.active_window)
+
+    def _build_preferences_dialog(self) -> Adw.PreferencesDialog:
+        # Built once; the GSettings bindings stay live between presentations
         preferences = Adw.PreferencesDialog()
 
+        # Hold back writes while the dialog is open and store them in one
+        # pass when it closes, rather than once per SpinRow step
+        self.settings.delay()
+        preferences.connect("closed", lambda *_: self.settings.apply())
+
         settings_page = Adw.PreferencesPage()
         settings_page.set_icon_name("applications-system-symbolic")
         preferences.add(settings_page)
@@ -166,7 +193,7 @@ class LunaApplication(Adw.Application):
             "period-length", period_length, "value", Gio.SettingsBindFlags.DEFAULT
         )
 
-        preferences.present(self.props.active_window)
+        return preferences
 
     def create_action(
         self,
@@ -181,15 +208,10 @@ class LunaApplication(Adw.Application):
             self.set_accels_for_action(f"app.{name}", shortcuts)
 
     def apply_color_scheme(self):
-        style = Adw.StyleManager.get_default()
         mode = self.settings.get_int("color-scheme")
-
-        if mode == ColorSchemeMode.LIGHT:
-            style.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
-        elif mode == ColorSchemeMode.DARK:
-            style.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-        else:
-            style.set_color_scheme(Adw.ColorScheme.DEFAULT)
+        Adw.StyleManager.get_default().set_color_scheme(
+            _COLOR_SCHEMES.get(mode, Adw.ColorScheme.DEFAULT)
+        )
 
 
 def main(version: str) -> int:
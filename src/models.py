@@ -19,13 +19,35 @@
 
 from __future__ import annotations
 
+import re
+import sys
 import uuid
 from dataclasses import dataclass, field
-from datetime import date, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
 
 
-@dataclass
+# Same shapes strptime("%Y-%m-%d") accepts, e.g. 2025-01-05 and 2025-1-5
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+
+def parse_date(text: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD date entered by the user, or return None."""
+    match = _DATE_RE.fullmatch(text)
+    if match is None:
+        return None
+    try:
+        return date(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+
+def intern_symptoms(symptoms: Iterable[str]) -> List[str]:
+    """Return symptoms as interned strings so repeated ones share memory."""
+    return [sys.intern(s) for s in symptoms]
+
+
+@dataclass(slots=True)
 class DayEntry:
     """Represents a single day in a menstrual cycle."""
 
@@ -52,7 +74,7 @@ class DayEntry:
         """Create a DayEntry instance from a dictionary representation."""
         return DayEntry(
             date=date.fromisoformat(data["date"]),
-            symptoms=data.get("symptoms", []),
+            symptoms=intern_symptoms(data.get("symptoms") or ()),
             mood=data.get("mood"),
             temperature=data.get("temperature"),
             flow=data.get("flow"),
@@ -60,7 +82,7 @@ class DayEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Pregnancy:
     """Represents a pregnancy event."""
 
@@ -108,7 +130,7 @@ class Pregnancy:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Cycle:
     """Represents a complete menstrual cycle and its tracked data."""
 
@@ -117,19 +139,21 @@ class Cycle:
     duration: int = 0  # bleeding days
     pregnancy_id: Optional[str] = None  # link to pregnancy
     days: List[DayEntry] = field(default_factory=list)
+    _pregnancy_obj: Optional[Pregnancy] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def generate_days(self):
         """Generate DayEntry objects for this cycle based on duration."""
         if not self.days:
-            self.days = [
-                DayEntry(date=self.start_date + timedelta(days=i))
-                for i in range(self.duration)
-            ]
+            start = self.start_date.toordinal()
+            dates = map(date.fromordinal, range(start, start + self.duration))
+            self.days = list(map(DayEntry, dates))
 
     @property
     def pregnancy(self) -> Optional[Pregnancy]:
         """Get the linked Pregnancy object, if any."""
-        return getattr(self, "_pregnancy_obj", None)
+        return self._pregnancy_obj
 
     @pregnancy.setter
     def pregnancy(self, value: Optional[Pregnancy]) -> None:
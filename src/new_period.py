@@ -19,12 +19,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from gettext import gettext as _
 
 from gi.repository import Adw, GLib, GObject, Gtk  # type: ignore
 
-from .models import Cycle
+from .models import Cycle, parse_date
 
 
 @Gtk.Template(resource_path="/io/github/kingorgg/Luna/new_period.ui")
@@ -62,9 +61,8 @@ class NewPeriodPage(Adw.NavigationPage):
         start_date_str = self.start_date.get_text()
         duration = int(self.duration.get_value())
 
-        try:
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-        except ValueError:
+        start_date = parse_date(start_date_str.strip())
+        if start_date is None:
             toast_overlay = self.get_root().get_content()
             toast = Adw.Toast.new(_("Invalid date format (use YYYY-MM-DD)"))
             toast_overlay.add_toast(toast)
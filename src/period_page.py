@@ -19,16 +19,18 @@
 
 from __future__ import annotations, print_function
 
+import hashlib
+import re
+import struct
 from datetime import date as DateType
-from datetime import datetime, timedelta
 from gettext import gettext as gettext_
 from typing import Optional
 
-from gi.repository import Adw, GObject, Gtk  # type: ignore
+from gi.repository import Adw, GLib, GObject, Gtk  # type: ignore
 
 from .day_row import DayRow
 from .delete_period_dialog import DeletePeriodDialog
-from .models import Cycle, DayEntry, Pregnancy
+from .models import Cycle, DayEntry, Pregnancy, intern_symptoms, parse_date
 
 
 class _InvalidDueDate:
@@ -37,6 +39,8 @@ class _InvalidDueDate:
 
 _INVALID_DUE_DATE = _InvalidDueDate()
 
+_SYMPTOM_SPLIT = re.compile(r"\s*,\s*")
+
 
 @Gtk.Template(resource_path="/io/github/kingorgg/Luna/period_page.ui")
 class PeriodPage(Adw.NavigationPage):
@@ -61,11 +65,21 @@ class PeriodPage(Adw.NavigationPage):
         super().__init__(**kwargs)
         self.cycle = cycle
         self.days = list(cycle.days)
+        self._rows: list[DayRow] = []
+        self._row_pool: list[DayRow] = []
+        self._pending_len = len(self.days)
+        self._duration_source = 0
+        self._orig_signature: Optional[bytes] = None
+        self._delete_dialog: Optional[DeletePeriodDialog] = None
+        self._duration_handler_id: Optional[int] = None
 
         self.connect("map", self.on_map)
+        self.connect("unrealize", self._on_unrealize)
 
     def on_map(self, *_):
         self.store = self.get_root().store
+        self._toast_overlay = self.get_native().toast_overlay
+        self._nav = self.get_ancestor(Adw.NavigationView)
 
         self.start_date.set_text(self.cycle.start_date.isoformat())
         self.duration.set_value(self.cycle.duration)
@@ -80,37 +94,100 @@ class PeriodPage(Adw.NavigationPage):
 
         self.days = list(self.cycle.days)
         self.rebuild_days()
+        self._orig_signature = self._form_signature()
 
-        self.duration.connect("changed", self.on_duration_changed)
+        # The page is mapped again when navigating back to it
+        if self._duration_handler_id is None:
+            self._duration_handler_id = self.duration.connect(
+                "changed", self.on_duration_changed
+            )
 
     def rebuild_days(self):
         """Rebuild the list of day entries in the UI."""
-        self.days_list.remove_all()
+        # Rebind the rows already in the list before creating any more
+        for row, day in zip(self._rows, self.days):
+            row.rebind(day)
+
+        for idx in range(len(self._rows), len(self.days)):
+            self._append_day_row(idx, self.days[idx])
+
+        self._trim_day_rows(len(self.days))
+
+    def _append_day_row(self, index: int, day: DayEntry) -> None:
+        """Append a row for a day to the end of the list."""
+        if self._row_pool:
+            row = self._row_pool.pop()
+            row.rebind(day)
+        else:
+            row = self.build_day_row(index, day)
+        self.days_list.append(row)
+        self._rows.append(row)
 
-        for idx, day in enumerate(self.days):
-            row = self.build_day_row(idx, day)
-            self.days_list.append(row)
+    def _trim_day_rows(self, length: int) -> None:
+        """Remove rows past length, keeping them for reuse."""
+        for row in reversed(self._rows[length:]):
+            self.days_list.remove(row)
+            self._row_pool.append(row)
+        del self._rows[length:]
 
     def build_day_row(self, index: int, day: DayEntry) -> Adw.ExpanderRow:
         return DayRow(day)
 
     def on_duration_changed(self, spin: Adw.SpinRow):
         """Handle changes to the duration spin row."""
-        new_len = int(spin.get_value())
+        # Spinning emits once per step; only apply the final value
+        self._pending_len = int(spin.get_value())
+        if not self._duration_source:
+            self._duration_source = GLib.idle_add(self._apply_duration)
+
+    def _cancel_duration_update(self) -> None:
+        """Remove a scheduled duration update, if any."""
+        if self._duration_source:
+            GLib.source_remove(self._duration_source)
+            self._duration_source = 0
+
+    def _on_unrealize(self, *_) -> None:
+        # Do not touch the rows of a page that has been torn down
+        self._cancel_duration_update()
+
+    def _apply_duration(self) -> bool:
+        """Resize the day rows to the pending duration."""
+        self._duration_source = 0
+        new_len = self._pending_len
         current_len = len(self.days)
 
+        # Only the trailing rows change, so leave the existing ones alone
         if new_len > current_len:
-            start = self.cycle.start_date
-            for i in range(current_len, new_len):
-                self.days.append(DayEntry(date=start + timedelta(days=i)))
+            start = self.cycle.start_date.toordinal()
+            dates = range(start + current_len, start + new_len)
+            for i, day in enumerate(
+                map(DayEntry, map(DateType.fromordinal, dates)), current_len
+            ):
+                self.days.append(day)
+                self._append_day_row(i, day)
+                # New days are saved with the labels their rows show
+                self._rows[-1].dirty = True
         elif new_len < current_len:
-            self.days = self.days[:new_len]
+            self._trim_day_rows(new_len)
+            del self.days[new_len:]
 
-        self.rebuild_days()
+        return GLib.SOURCE_REMOVE
 
     @Gtk.Template.Callback()
     def on_save_button_clicked(self, *_):
         """Callback for the save button click event."""
+        if self._duration_source:
+            self._cancel_duration_update()
+            self._apply_duration()
+
+        # Nothing was edited, so there is nothing to write
+        if (
+            self.cycle.id is not None
+            and self._form_signature() == self._orig_signature
+        ):
+            self._finish_edit()
+            return
+
         new_start = self._get_valid_start_date()
         if not new_start:
             return
@@ -130,9 +207,10 @@ class PeriodPage(Adw.NavigationPage):
     @Gtk.Template.Callback()
     def on_delete_button_clicked(self, button: Gtk.Button) -> None:
         """Handle the delete button click event."""
-        dialog = DeletePeriodDialog()
-        dialog.connect("response", self._on_delete_dialog_response)
-        dialog.present(self.get_root())
+        if self._delete_dialog is None:
+            self._delete_dialog = DeletePeriodDialog()
+            self._delete_dialog.connect("response", self._on_delete_dialog_response)
+        self._delete_dialog.present(self.get_root())
 
     def _on_delete_dialog_response(self, dialog, response):
         """Handle the response from the delete confirmation dialog."""
@@ -150,16 +228,14 @@ class PeriodPage(Adw.NavigationPage):
 
     def _show_toast(self, message: str) -> None:
         """Show a toast with the given message."""
-        toast = Adw.Toast.new(message)
-        self.get_native().toast_overlay.add_toast(toast)
+        self._toast_overlay.add_toast(Adw.Toast.new(message))
 
     def _parse_date_or_toast(self, text: str, error_msg: str) -> Optional[DateType]:
         """Parse a date string or show a toast with an error message."""
-        try:
-            return datetime.strptime(text, "%Y-%m-%d").date()
-        except ValueError:
+        parsed = parse_date(text)
+        if parsed is None:
             self._show_toast(error_msg)
-            return None
+        return parsed
 
     def _get_valid_date(
         self, text: str, error_msg: str, allow_empty=False
@@ -188,6 +264,29 @@ class PeriodPage(Adw.NavigationPage):
 
         return result if result is not None else _INVALID_DUE_DATE
 
+    def _form_signature(self) -> bytes:
+        """Return a digest of the form values for change detection."""
+        # GTK text never contains NUL, so it safely terminates each field
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            struct.pack(
+                "<I?",
+                int(self.duration.get_value()),
+                self.pregnancy_toggle.get_active(),
+            )
+        )
+        for text in (self.start_date.get_text(), self.edd_date.get_text()):
+            digest.update(text.strip().encode() + b"\0")
+
+        for row in self._rows:
+            digest.update(
+                struct.pack("<II", row.flow.get_selected(), row.mood.get_selected())
+            )
+            for entry in (row.temp, row.symptoms, row.notes):
+                digest.update(entry.get_text().strip().encode() + b"\0")
+
+        return digest.digest()
+
     def _update_cycle_core(self, start_date: DateType) -> None:
         """Update the cycle core with the given start date."""
         self.cycle.start_date = start_date
@@ -234,22 +333,26 @@ class PeriodPage(Adw.NavigationPage):
 
     def _update_days(self) -> None:
         """Update the days in the cycle."""
-        self.cycle.days = [
-            self._read_day_row(i, day) for i, day in enumerate(self.days)
-        ]
+        # Untouched rows still match their DayEntry, so skip reading them
+        for row, day in zip(self._rows, self.days):
+            if row.dirty:
+                self._read_day_row(row, day)
+                row.dirty = False
 
-    def _read_day_row(self, index: int, day: DayEntry) -> DayEntry:
-        """Read a day row."""
-        row = self.days_list.get_row_at_index(index)
+        # on_map copies the list again, so the cycle can take this one as is
+        self.cycle.days = self.days
 
-        day.flow = row.flow.get_model().get_string(row.flow.get_selected())
-        day.mood = row.mood.get_model().get_string(row.mood.get_selected())
+    def _read_day_row(self, row: DayRow, day: DayEntry) -> DayEntry:
+        """Read a day row."""
+        flow, mood = row.flow, row.mood
+        day.flow = flow.get_model().get_string(flow.get_selected())
+        day.mood = mood.get_model().get_string(mood.get_selected())
 
         temp = row.temp.get_text().strip()
         day.temperature = float(temp) if temp else None
 
         symptoms = row.symptoms.get_text().strip()
-        day.symptoms = [s.strip() for s in symptoms.split(",")] if symptoms else []
+        day.symptoms = intern_symptoms(s for s in _SYMPTOM_SPLIT.split(symptoms) if s)
 
         day.notes = row.notes.get_text().strip() or None
 
@@ -264,9 +367,8 @@ class PeriodPage(Adw.NavigationPage):
 
     def _pop_navigation(self) -> None:
         """Pop the navigation view."""
-        nav = self.get_ancestor(Adw.NavigationView)
-        if nav:
-            nav.pop()
+        if self._nav:
+            self._nav.pop()
 
     def _finish_edit(self) -> None:
         """Finish editing the cycle."""
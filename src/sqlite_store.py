@@ -21,12 +21,142 @@ import json
 import sqlite3
 from contextlib import contextmanager
 from datetime import date
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Optional
 
 from gi.repository import GLib
 
-from .models import Cycle, DayEntry, Pregnancy
+from .models import Cycle, DayEntry, Pregnancy, intern_symptoms
+
+
+def _convert_isodate(value: bytes) -> date:
+    """Convert a stored ISO-8601 date, as selected with an [isodate] hint."""
+    return date.fromisoformat(value.decode())
+
+
+sqlite3.register_converter("isodate", _convert_isodate)
+
+# Column lists follow the dataclass field order so rows construct positionally
+_CYCLE_COLUMNS = """
+    id, start_date AS "start_date [isodate]", duration, pregnancy_id
+"""
+
+_PREGNANCY_COLUMNS = """
+    start_date AS "start_date [isodate]", confirmed,
+    end_date AS "end_date [isodate]", notes,
+    custom_due_date AS "custom_due_date [isodate]", id
+"""
+
+_CREATE_PREGNANCIES = """
+    CREATE TABLE {table} (
+        id TEXT PRIMARY KEY,
+        start_date TEXT UNIQUE NOT NULL,
+        confirmed INTEGER NOT NULL,
+        end_date TEXT,
+        notes TEXT,
+        custom_due_date TEXT
+    ) WITHOUT ROWID
+"""
+
+# Statements are shared module constants so the connection's statement
+# cache reuses their prepared form
+_SELECT_CYCLES = """
+    SELECT c.id, c.start_date AS "start_date [isodate]", c.duration,
+           c.pregnancy_id, d.date AS "date [isodate]", d.mood,
+           d.temperature, d.flow, d.notes, d.symptoms
+    FROM cycles c
+    LEFT JOIN day_entries d ON d.cycle_id = c.id
+    ORDER BY c.start_date, d.date
+"""
+
+_SELECT_DAYS_FOR_CYCLE = """
+    SELECT date AS "date [isodate]", mood, temperature, flow, notes, symptoms
+    FROM day_entries WHERE cycle_id = ? ORDER BY date
+"""
+
+_INSERT_CYCLE = """
+    INSERT INTO cycles
+    (start_date, duration, pregnancy_id)
+    VALUES (?, ?, ?)
+    RETURNING id
+"""
+
+_UPDATE_CYCLE = """
+    UPDATE cycles
+    SET start_date = ?, duration = ?, pregnancy_id = ?
+    WHERE id = ?
+"""
+
+_INSERT_DAY_ENTRY = """
+    INSERT INTO day_entries
+    (cycle_id, date, mood, temperature, flow, notes, symptoms)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PREGNANCY = """
+    INSERT INTO pregnancies
+    (id, start_date, confirmed, end_date, notes, custom_due_date)
+    VALUES (:id, :start_date, :confirmed, :end_date, :notes, :custom_due_date)
+"""
+
+_UPDATE_PREGNANCY = """
+    UPDATE pregnancies
+    SET start_date = :start_date, confirmed = :confirmed,
+        end_date = :end_date, notes = :notes,
+        custom_due_date = :custom_due_date
+    WHERE id = :id
+    AND (start_date, confirmed, end_date, notes, custom_due_date)
+        IS NOT (:start_date, :confirmed, :end_date, :notes, :custom_due_date)
+"""
+
+
+def _iso(value: Optional[date]) -> Optional[str]:
+    """Format an optional date as ISO-8601 text for storage."""
+    return value.isoformat() if value else None
+
+
+def _day_entry(day_date, mood, temperature, flow, notes, symptoms) -> DayEntry:
+    """Build a DayEntry from the day_entries columns, in table order."""
+    return DayEntry(
+        day_date,
+        intern_symptoms(json.loads(symptoms)) if symptoms else [],
+        mood,
+        temperature,
+        flow,
+        notes,
+    )
+
+
+def _day_entry_params(cycle_id: int, day: DayEntry) -> tuple:
+    """Return the parameters inserting day into day_entries."""
+    return (
+        cycle_id,
+        day.date.isoformat(),
+        day.mood,
+        day.temperature,
+        day.flow,
+        day.notes,
+        json.dumps(day.symptoms) if day.symptoms else None,
+    )
+
+
+def _pregnancy_params(pregnancy: Pregnancy) -> dict:
+    """Return the named parameters writing pregnancy to pregnancies."""
+    return {
+        "id": pregnancy.id,
+        "start_date": pregnancy.start_date.isoformat(),
+        "confirmed": int(pregnancy.confirmed),
+        "end_date": _iso(pregnancy.end_date),
+        "notes": pregnancy.notes,
+        "custom_due_date": _iso(pregnancy.custom_due_date),
+    }
+
+
+def _pregnancy(row: sqlite3.Row) -> Pregnancy:
+    """Build a Pregnancy from a row selected with _PREGNANCY_COLUMNS."""
+    return Pregnancy(*row)
 
 
 class SQLiteStore:
@@ -39,71 +169,95 @@ class SQLiteStore:
             self.db_path = Path(db_path)
 
         self.conn = sqlite3.connect(
-            self.db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+            self.db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            cached_statements=256,
+            isolation_level=None,
         )
 
-        self.conn.execute("PRAGMA foreign_keys = ON")
-        self.conn.execute("PRAGMA journal_mode = WAL")
-        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(
+            """
+            PRAGMA foreign_keys = ON;
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -20000;
+            """
+        )
+
+        # Memory-mapped reads are best effort; not every platform allows them
+        try:
+            self.conn.execute("PRAGMA mmap_size = 268435456")
+        except sqlite3.DatabaseError:
+            pass
 
         self.conn.row_factory = sqlite3.Row
-        self.cursor = self.conn.cursor()
 
         self._init_schema()
 
     def _init_schema(self):
-        self.cursor.execute(
+        with self.transaction():
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cycles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    start_date TEXT UNIQUE NOT NULL,
+                    duration INTEGER NOT NULL,
+                    pregnancy_id TEXT
+                )
             """
-            CREATE TABLE IF NOT EXISTS cycles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                start_date TEXT UNIQUE NOT NULL,
-                duration INTEGER NOT NULL,
-                pregnancy_id TEXT
             )
-        """
-        )
 
-        self.cursor.execute(
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS day_entries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    cycle_id INTEGER NOT NULL,
+                    date TEXT NOT NULL,
+                    mood TEXT,
+                    temperature REAL,
+                    flow TEXT,
+                    notes TEXT,
+                    symptoms TEXT,
+                    FOREIGN KEY (cycle_id) REFERENCES cycles(id) ON DELETE CASCADE,
+                    UNIQUE (cycle_id, date)
+                )
             """
-            CREATE TABLE IF NOT EXISTS day_entries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cycle_id INTEGER NOT NULL,
-                date TEXT NOT NULL,
-                mood TEXT,
-                temperature REAL,
-                flow TEXT,
-                notes TEXT,
-                symptoms TEXT,
-                FOREIGN KEY (cycle_id) REFERENCES cycles(id) ON DELETE CASCADE,
-                UNIQUE (cycle_id, date)
             )
-        """
-        )
 
-        self.cursor.execute(
+            self._init_pregnancies_table()
+
+    def _init_pregnancies_table(self) -> None:
+        """Create the pregnancies table, rebuilding older rowid tables."""
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+            ("pregnancies",),
+        ).fetchone()
+
+        if row is None:
+            self.conn.execute(_CREATE_PREGNANCIES.format(table="pregnancies"))
+        elif "WITHOUT ROWID" not in row["sql"].upper():
+            # Keyed by UUID, so the table is clustered on id rather than
+            # carrying a hidden rowid and a separate primary key index
+            self.conn.execute(_CREATE_PREGNANCIES.format(table="pregnancies_new"))
+            self.conn.execute(
+                """
+                INSERT INTO pregnancies_new
+                (id, start_date, confirmed, end_date, notes, custom_due_date)
+                SELECT id, start_date, confirmed, end_date, notes, custom_due_date
+                FROM pregnancies
             """
-            CREATE TABLE IF NOT EXISTS pregnancies (
-                id TEXT PRIMARY KEY,
-                start_date TEXT UNIQUE NOT NULL,
-                confirmed INTEGER NOT NULL,
-                end_date TEXT,
-                notes TEXT,
-                custom_due_date TEXT
             )
-        """
-        )
-
-        self.conn.commit()
+            self.conn.execute("DROP TABLE pregnancies")
+            self.conn.execute("ALTER TABLE pregnancies_new RENAME TO pregnancies")
 
     @contextmanager
     def transaction(self):
-        try:
-            self.conn.execute("BEGIN TRANSACTION")
+        # Autocommit mode leaves BEGIN to us; the connection context
+        # manager commits on success and rolls back if the body raises
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
             yield
-            self.conn.commit()
-        except Exception:
-            self.conn.rollback()
-            raise
 
     def close(self) -> None:
         """Close the SQLite connection."""
@@ -112,20 +266,15 @@ class SQLiteStore:
 
     def get_cycles(self) -> List[Cycle]:
         """Return all stored cycles."""
-        self.cursor.execute("SELECT * FROM cycles")
+        # Fetch cycles and their days in one query rather than one per cycle
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(_SELECT_CYCLES)
         cycles = []
 
-        for row in self.cursor.fetchall():
-            cycle_id = row["id"]
-
-            cycle = Cycle(
-                id=cycle_id,
-                start_date=date.fromisoformat(row["start_date"]),
-                duration=row["duration"],
-                pregnancy_id=row["pregnancy_id"],
-                days=self._get_days_for_cycle(cycle_id),
-            )
-            cycles.append(cycle)
+        for cycle_row, rows in groupby(cursor, key=itemgetter(0, 1, 2, 3)):
+            days = [_day_entry(*row[4:]) for row in rows if row[4] is not None]
+            cycles.append(Cycle(*cycle_row, days))
 
         self._link_pregnancies(cycles)
         return cycles
@@ -133,48 +282,50 @@ class SQLiteStore:
     def insert_cycle(self, cycle: Cycle) -> None:
         """Insert a new cycle into the database."""
         with self.transaction():
-            self.cursor.execute(
-                """
-                INSERT INTO cycles
-                (start_date, duration, pregnancy_id)
-                VALUES (?, ?, ?)
-                """,
-                (
-                    cycle.start_date.isoformat(),
-                    cycle.duration,
-                    cycle.pregnancy_id,
-                ),
-            )
+            self._insert_cycle(cycle)
 
-            cycle.id = self.cursor.lastrowid
-            self._insert_day_entries(cycle.id, cycle.days)
+    def insert_cycles(self, cycles: List[Cycle]) -> None:
+        """Insert several new cycles in a single transaction."""
+        with self.transaction():
+            for cycle in cycles:
+                self._insert_cycle(cycle)
 
     def update_cycle(self, cycle: Cycle) -> None:
         """Update an existing cycle."""
-        if cycle.id is None:
+        self.update_cycles([cycle])
+
+    def update_cycles(self, cycles: List[Cycle]) -> None:
+        """Update several existing cycles in a single transaction."""
+        if any(cycle.id is None for cycle in cycles):
             raise ValueError("Cannot update cycle without ID")
 
         with self.transaction():
-            self.cursor.execute(
-                """
-                UPDATE cycles
-                SET start_date = ?, duration = ?, pregnancy_id = ?
-                WHERE id = ?
-                """,
-                (
-                    cycle.start_date.isoformat(),
-                    cycle.duration,
-                    cycle.pregnancy_id,
-                    cycle.id,
-                ),
+            self.conn.executemany(
+                _UPDATE_CYCLE,
+                [
+                    (
+                        cycle.start_date.isoformat(),
+                        cycle.duration,
+                        cycle.pregnancy_id,
+                        cycle.id,
+                    )
+                    for cycle in cycles
+                ],
             )
 
             # Replace days
-            self.cursor.execute(
+            self.conn.executemany(
                 "DELETE FROM day_entries WHERE cycle_id = ?",
-                (cycle.id,),
+                [(cycle.id,) for cycle in cycles],
+            )
+            self.conn.executemany(
+                _INSERT_DAY_ENTRY,
+                [
+                    _day_entry_params(cycle.id, day)
+                    for cycle in cycles
+                    for day in cycle.days
+                ],
             )
-            self._insert_day_entries(cycle.id, cycle.days)
 
     def delete_cycle(self, cycle: Cycle) -> None:
         """Delete a cycle and its associated day entries."""
@@ -182,155 +333,112 @@ class SQLiteStore:
             raise ValueError("Cannot delete cycle without ID")
 
         with self.transaction():
-            self.cursor.execute(
+            self.conn.execute(
                 "DELETE FROM cycles WHERE id = ?",
                 (cycle.id,),
             )
 
     def get_active_cycle(self) -> Optional[Cycle]:
         """Return the most recent (active) cycle, or None if none exist."""
-        cycles = self.get_cycles()
-        return cycles[-1] if cycles else None
+        row = self.conn.execute(
+            f"SELECT {_CYCLE_COLUMNS} FROM cycles ORDER BY start_date DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+
+        cycle = Cycle(*row, self._get_days_for_cycle(row["id"]))
+        self._link_pregnancies([cycle])
+        return cycle
 
     def get_pregnancies(self) -> List[Pregnancy]:
         """Return all stored pregnancies."""
-        self.cursor.execute("SELECT * FROM pregnancies ORDER BY start_date")
-        pregnancies = []
-
-        for row in self.cursor.fetchall():
-            pregnancy = Pregnancy(
-                id=row["id"],
-                start_date=date.fromisoformat(row["start_date"]),
-                confirmed=row["confirmed"],
-                end_date=(
-                    date.fromisoformat(row["end_date"]) if row["end_date"] else None
-                ),
-                custom_due_date=(
-                    date.fromisoformat(row["custom_due_date"])
-                    if row["custom_due_date"]
-                    else None
-                ),
-                notes=row["notes"],
-            )
-            pregnancies.append(pregnancy)
-        return pregnancies
+        cursor = self.conn.execute(
+            f"SELECT {_PREGNANCY_COLUMNS} FROM pregnancies ORDER BY start_date"
+        )
+        return [_pregnancy(row) for row in cursor]
 
     def insert_pregnancy(self, pregnancy: Pregnancy) -> None:
         """Insert a new pregnancy into the database."""
+        self.insert_pregnancies([pregnancy])
+
+    def insert_pregnancies(self, pregnancies: List[Pregnancy]) -> None:
+        """Insert several new pregnancies in a single transaction."""
         with self.transaction():
-            self.cursor.execute(
-                """
-                INSERT INTO pregnancies
-                (id, start_date, confirmed, end_date, notes, custom_due_date)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    pregnancy.id,
-                    pregnancy.start_date.isoformat(),
-                    int(pregnancy.confirmed),
-                    pregnancy.end_date.isoformat() if pregnancy.end_date else None,
-                    pregnancy.notes,
-                    (
-                        pregnancy.custom_due_date.isoformat()
-                        if pregnancy.custom_due_date
-                        else None
-                    ),
-                ),
+            self.conn.executemany(
+                _INSERT_PREGNANCY, [_pregnancy_params(p) for p in pregnancies]
             )
 
-    def update_pregnancy(self, pregnancy: Pregnancy) -> None:
-        """Update an existing pregnancy in the database."""
+    def update_pregnancy(self, pregnancy: Pregnancy) -> bool:
+        """Update an existing pregnancy, returning False if nothing changed."""
         with self.transaction():
-            self.cursor.execute(
-                """
-                UPDATE pregnancies
-                SET start_date = ?, confirmed = ?, end_date = ?, notes = ?, custom_due_date = ?
-                WHERE id = ?
-                """,
-                (
-                    pregnancy.start_date.isoformat(),
-                    int(pregnancy.confirmed),
-                    pregnancy.end_date.isoformat() if pregnancy.end_date else None,
-                    pregnancy.notes,
-                    (
-                        pregnancy.custom_due_date.isoformat()
-                        if pregnancy.custom_due_date
-                        else None
-                    ),
-                    pregnancy.id,
-                ),
-            )
+            # Rows already holding these values are skipped, so an
+            # unchanged pregnancy costs no write
+            cursor = self.conn.execute(_UPDATE_PREGNANCY, _pregnancy_params(pregnancy))
+            return cursor.rowcount > 0
 
     def delete_pregnancy(self, pregnancy: Pregnancy) -> None:
         """Delete a pregnancy."""
         with self.transaction():
-            self.cursor.execute(
+            self.conn.execute(
                 "DELETE FROM pregnancies WHERE id = ?",
                 (pregnancy.id,),
             )
 
     def get_active_pregnancy(self) -> Optional[Pregnancy]:
         """Return the most recent (active) pregnancy, or None if none exist."""
-        pregnancies = self.get_pregnancies()
-        return pregnancies[-1] if pregnancies else None
+        row = self.conn.execute(
+            f"SELECT {_PREGNANCY_COLUMNS} FROM pregnancies"
+            " ORDER BY start_date DESC LIMIT 1"
+        ).fetchone()
+        return _pregnancy(row) if row else None
 
     def _get_days_for_cycle(self, cycle_id: str) -> List[DayEntry]:
         """Return all stored days for a given cycle."""
-        self.cursor.execute(
-            "SELECT * FROM day_entries WHERE cycle_id = ? ORDER BY date",
+        # Plain tuples unpack faster than sqlite3.Row for this bulk read
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            _SELECT_DAYS_FOR_CYCLE,
             (cycle_id,),
         )
 
-        days = []
-        for row in self.cursor.fetchall():
-            days.append(
-                DayEntry(
-                    date=date.fromisoformat(row["date"]),
-                    mood=row["mood"],
-                    temperature=row["temperature"],
-                    flow=row["flow"],
-                    notes=row["notes"],
-                    symptoms=json.loads(row["symptoms"]) if row["symptoms"] else [],
-                )
-            )
+        return [_day_entry(*row) for row in cursor]
+
+    def _insert_cycle(self, cycle: Cycle) -> None:
+        """Insert a cycle and its days; the caller owns the transaction."""
+        cursor = self.conn.execute(
+            _INSERT_CYCLE,
+            (
+                cycle.start_date.isoformat(),
+                cycle.duration,
+                cycle.pregnancy_id,
+            ),
+        )
 
-        return days
+        cycle.id = cursor.fetchone()[0]
+        self._insert_day_entries(cycle.id, cycle.days)
 
     def _insert_day_entries(self, cycle_id: int, days: List[DayEntry]) -> None:
         """Insert day entries into the database."""
-        for day in days:
-            self.cursor.execute(
-                """
-                INSERT INTO day_entries
-                (cycle_id, date, mood, temperature, flow, notes, symptoms)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    cycle_id,
-                    day.date.isoformat(),
-                    day.mood,
-                    day.temperature,
-                    day.flow,
-                    day.notes,
-                    json.dumps(day.symptoms),
-                ),
-            )
+        self.conn.executemany(
+            _INSERT_DAY_ENTRY,
+            [_day_entry_params(cycle_id, day) for day in days],
+        )
 
     def _link_pregnancies(self, cycles: List[Cycle]) -> None:
         """Link pregnancies to cycles."""
-        pregnancies = {p.id: p for p in self.get_pregnancies()}
+        # Only load the pregnancies that some cycle actually refers to
+        ids = list({c.pregnancy_id for c in cycles if c.pregnancy_id})
+        if not ids:
+            return
+
+        cursor = self.conn.execute(
+            f"SELECT {_PREGNANCY_COLUMNS} FROM pregnancies"
+            f" WHERE id IN ({', '.join('?' * len(ids))})",
+            ids,
+        )
+        pregnancies = {row["id"]: _pregnancy(row) for row in cursor}
 
         for cycle in cycles:
             if cycle.pregnancy_id:
                 cycle.pregnancy = pregnancies.get(cycle.pregnancy_id)
-
-    def _get_cycle_id(self, start_date: date) -> int:
-        """Get the ID of a cycle by its start date."""
-        self.cursor.execute(
-            "SELECT id FROM cycles WHERE start_date = ?",
-            (start_date.isoformat(),),
-        )
-        row = self.cursor.fetchone()
-        if row is None:
-            raise ValueError("Cycle not found")
-        return row["id"]
@@ -22,19 +22,18 @@ from __future__ import annotations
 import logging
 from datetime import date, timedelta
 from gettext import gettext as _
-from typing import Any, List
+from typing import Any, List, Optional
 
 from gi.repository import Adw, GLib, Gtk  # type: ignore
 
-from .data_store import DataStore
 from .logic import CycleStats
 from .models import Cycle, Pregnancy
 from .new_period import NewPeriodPage
 from .period_page import PeriodPage
 
 
-def get_gestation(preg):
-    today = date.today()
+def get_gestation(preg, today=None):
+    today = today or date.today()
     delta = today - preg.start_date
     weeks = delta.days // 7
     days = delta.days % 7
@@ -57,6 +56,13 @@ def format_edd_window(due: date) -> str:
     return f"{early.isoformat()} ← <u><b>{due.isoformat()}</b></u> → {late.isoformat()}"
 
 
+def _sort_newest_first(row1: Adw.ActionRow, row2: Adw.ActionRow) -> int:
+    """Order history rows by start date, newest first."""
+    # Titles are ISO dates, so they compare in date order
+    a, b = row1.get_title(), row2.get_title()
+    return (a < b) - (a > b)
+
+
 @Gtk.Template(resource_path="/io/github/kingorgg/Luna/window.ui")
 class LunaWindow(Adw.ApplicationWindow):
     __gtype_name__ = "LunaWindow"
@@ -80,12 +86,25 @@ class LunaWindow(Adw.ApplicationWindow):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.settings = self.get_application().settings
-        self.store = DataStore()
+        self.store = self.get_application().data_store
         self.logger = logging.getLogger(__name__)
 
-        self.store.connect("changed", self._on_store_changed)
+        self._stats: Optional[CycleStats] = None
+        self._stats_key: Optional[tuple] = None
+        self._refresh_pending = 0
+
+        # History rows are kept between refreshes and sorted newest first
+        self._history_rows: dict[int, tuple[tuple, Adw.ActionRow]] = {}
+        self._cycles_by_id: dict[int, Cycle] = {}
+        self.history_box.set_sort_func(_sort_newest_first)
+
+        # The store outlives the window, so drop the handler with it
+        self._store_handler_id = self.store.connect(
+            "changed", self._on_store_changed
+        )
+        self.connect("destroy", self._on_destroy)
 
-        GLib.idle_add(lambda: self.update_ui(refresh=True))
+        self._schedule_refresh()
 
     def update_ui(self, refresh: bool = False) -> None:
         """Update the UI with current data and predictions."""
@@ -94,7 +113,7 @@ class LunaWindow(Adw.ApplicationWindow):
                 self.store.reload()
             except Exception as e:
                 self.toast_overlay.add_toast(Adw.Toast.new(_("Error reloading data.")))
-                self.logger.error(f"Error reloading data: {e}")
+                self.logger.error("Error reloading data: %s", e)
                 return
 
         cycles = self.store.get_cycles()
@@ -103,14 +122,19 @@ class LunaWindow(Adw.ApplicationWindow):
         if latest is None:
             return self._show_empty_state()
 
+        today = date.today()
         if latest.pregnancy:
-            return self._show_pregnancy_state(latest.pregnancy, cycles)
+            return self._show_pregnancy_state(latest.pregnancy, cycles, today)
 
-        return self._show_cycle_prediction_state(cycles)
+        return self._show_cycle_prediction_state(cycles, today)
 
     def populate_history_list(self, cycles: list) -> None:
         """Populate the History list with past cycles."""
-        self.history_box.remove_all()
+        self._cycles_by_id = {c.id: c for c in cycles}
+
+        # Drop rows for deleted cycles, then rebuild only changed ones
+        for cycle_id in self._history_rows.keys() - self._cycles_by_id.keys():
+            self.history_box.remove(self._history_rows.pop(cycle_id)[1])
 
         if not cycles:
             self.history_stack.set_visible_child_name("empty")
@@ -118,15 +142,22 @@ class LunaWindow(Adw.ApplicationWindow):
 
         self.history_stack.set_visible_child_name("history")
 
-        for cycle in reversed(cycles):
-            self.history_box.append(self.build_history_row(cycle))
+        for cycle in cycles:
+            signature = (cycle.start_date, cycle.duration, cycle.pregnancy is not None)
+            current = self._history_rows.get(cycle.id)
+            if current is not None:
+                if current[0] == signature:
+                    continue
+                self.history_box.remove(current[1])
+
+            row = self.build_history_row(cycle)
+            self.history_box.append(row)
+            self._history_rows[cycle.id] = (signature, row)
 
     def build_history_row(self, cycle: Cycle) -> Adw.ActionRow:
         """Build a history row for a given cycle."""
-        start_str = cycle.start_date.strftime("%Y-%m-%d")
-        end_str = (cycle.start_date + timedelta(days=cycle.duration - 1)).strftime(
-            "%Y-%m-%d"
-        )
+        start_str = cycle.start_date.isoformat()
+        end_str = (cycle.start_date + timedelta(days=cycle.duration - 1)).isoformat()
 
         subtitle = f"→ {end_str} ({cycle.duration} days)"
         if cycle.pregnancy:
@@ -140,7 +171,7 @@ class LunaWindow(Adw.ApplicationWindow):
         edit_button.set_tooltip_text(_("View Period"))
         edit_button.set_valign(Gtk.Align.CENTER)
         edit_button.add_css_class("flat")
-        edit_button.connect("clicked", self.on_view_period_clicked, cycle)
+        edit_button.connect("clicked", self._on_history_row_clicked, cycle.id)
 
         row.add_suffix(edit_button)
 
@@ -153,6 +184,10 @@ class LunaWindow(Adw.ApplicationWindow):
         page.connect("period-saved", self.on_period_saved)
         self.content_view.push(page)
 
+    def _on_history_row_clicked(self, button: Gtk.Button, cycle_id: int) -> None:
+        # Rows outlive refreshes, so look up the cycle as last loaded
+        self.on_view_period_clicked(button, self._cycles_by_id[cycle_id])
+
     def on_view_period_clicked(self, button: Gtk.Button, cycle: Cycle) -> None:
         """Handle user clicking 'View Period' for a specific cycle."""
         page = PeriodPage(cycle)
@@ -178,11 +213,29 @@ class LunaWindow(Adw.ApplicationWindow):
     def on_period_deleted(self, page, cycle):
         """Handle the 'period-deleted' signal from PeriodPage."""
         self.toast_overlay.add_toast(Adw.Toast.new(_("Period deleted")))
-        self.update_ui(refresh=True)
+        self._schedule_refresh()
 
     def _on_store_changed(self, *_):
         """Handle changes in the data store."""
-        GLib.idle_add(lambda: self.update_ui(refresh=True))
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Refresh the UI once the main loop is idle, coalescing requests."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = GLib.idle_add(self._do_refresh)
+
+    def _do_refresh(self) -> bool:
+        self._refresh_pending = 0
+        self.update_ui(refresh=True)
+        return GLib.SOURCE_REMOVE
+
+    def _on_destroy(self, *_):
+        """Disconnect from the shared data store."""
+        self.store.disconnect(self._store_handler_id)
+        if self._refresh_pending:
+            GLib.source_remove(self._refresh_pending)
+            self._refresh_pending = 0
 
     def _show_empty_state(self):
         """Show the empty state when no cycles are recorded."""
@@ -205,9 +258,11 @@ class LunaWindow(Adw.ApplicationWindow):
             Adw.Toast.new(_("Add your first period to see predictions."))
         )
 
-    def _show_pregnancy_state(self, pregnancy: Pregnancy, cycles: List[Cycle]) -> None:
+    def _show_pregnancy_state(
+        self, pregnancy: Pregnancy, cycles: List[Cycle], today: date
+    ) -> None:
         """Show pregnancy information and pause predictions."""
-        weeks, days = get_gestation(pregnancy)
+        weeks, days = get_gestation(pregnancy, today)
         due = get_effective_due_date(pregnancy)
 
         self.predicted_period.set_title(_("Estimated Due Date (EDD)"))
@@ -233,13 +288,9 @@ class LunaWindow(Adw.ApplicationWindow):
 
         self.populate_history_list(cycles)
 
-    def _show_cycle_prediction_state(self, cycles):
+    def _show_cycle_prediction_state(self, cycles, today: date):
         """Show predictions and statistics based on cycles."""
-        stats = CycleStats(
-            cycles=cycles,
-            cycle_len=self.settings.get_int("cycle-length"),
-            luteal_len=self.settings.get_int("luteal-phase-length"),
-        )
+        stats = self._get_stats(cycles)
 
         self.predicted_period.set_title(_("Next Period"))
         self.ovulation.set_title(_("Ovulation Date"))
@@ -266,6 +317,24 @@ class LunaWindow(Adw.ApplicationWindow):
         self.cycle_range.set_subtitle(crange)
         self.cycle_std_dev.set_subtitle(f"{std_dev:.1f} days" if std_dev > 0 else "-")
 
-        self.current_phase.set_subtitle(stats.get_current_phase())
+        self.current_phase.set_subtitle(stats.get_current_phase(today))
 
         self.populate_history_list(cycles)
+
+    def _get_stats(self, cycles: List[Cycle]) -> CycleStats:
+        """Return stats for cycles, reusing the previous ones if nothing changed."""
+        cycle_len = self.settings.get_int("cycle-length")
+        luteal_len = self.settings.get_int("luteal-phase-length")
+
+        # Everything the statistics and predictions read from the cycles
+        key = (
+            cycle_len,
+            luteal_len,
+            tuple((c.start_date, c.duration, c.pregnancy is not None) for c in cycles),
+        )
+        if key != self._stats_key:
+            self._stats = CycleStats(
+                cycles=cycles, cycle_len=cycle_len, luteal_len=luteal_len
+            )
+            self._stats_key = key
+        return self._stats
@@ -2,6 +2,8 @@ import unittest
 from datetime import date
 from unittest.mock import MagicMock, patch
 
+from gi.repository import GLib  # type: ignore
+
 from src.data_store import DataStore
 from src.models import Cycle, Pregnancy
 
@@ -23,30 +25,76 @@ class TestDataStore(unittest.TestCase):
     def tearDown(self):
         self.store.close()
 
+    def _flush_idle(self):
+        # "changed" is emitted from an idle callback
+        context = GLib.MainContext.default()
+        while context.iteration(False):
+            pass
+
     def test_add_cycle_emits_changed(self):
         cycle = Cycle(start_date=date(2025, 12, 20), duration=3)
         callback = MagicMock()
         self.store.connect("changed", callback)
 
         self.store.add_cycle(cycle)
+        self._flush_idle()
         self.mock_sqlite.insert_cycle.assert_called_once_with(cycle)
         callback.assert_called_once()
 
+    def test_add_cycles_emits_changed_once(self):
+        cycles = [
+            Cycle(start_date=date(2025, 11, 20), duration=4),
+            Cycle(start_date=date(2025, 12, 20), duration=3),
+        ]
+        callback = MagicMock()
+        self.store.connect("changed", callback)
+
+        self.store.add_cycles(cycles)
+        self._flush_idle()
+        self.mock_sqlite.insert_cycles.assert_called_once_with(cycles)
+        callback.assert_called_once()
+
+    def test_changed_bursts_are_coalesced(self):
+        callback = MagicMock()
+        self.store.connect("changed", callback)
+
+        self.store.add_cycle(Cycle(start_date=date(2025, 11, 20), duration=4))
+        self.store.add_cycle(Cycle(start_date=date(2025, 12, 20), duration=3))
+        callback.assert_not_called()
+
+        self._flush_idle()
+        callback.assert_called_once()
+
     def test_update_cycle_emits_changed(self):
         cycle = Cycle(start_date=date(2025, 12, 20), duration=3)
         callback = MagicMock()
         self.store.connect("changed", callback)
 
         self.store.update_cycle(cycle)
+        self._flush_idle()
         self.mock_sqlite.update_cycle.assert_called_once_with(cycle)
         callback.assert_called_once()
 
+    def test_update_cycles_emits_changed_once(self):
+        cycles = [
+            Cycle(start_date=date(2025, 11, 20), duration=4),
+            Cycle(start_date=date(2025, 12, 20), duration=3),
+        ]
+        callback = MagicMock()
+        self.store.connect("changed", callback)
+
+        self.store.update_cycles(cycles)
+        self._flush_idle()
+        self.mock_sqlite.update_cycles.assert_called_once_with(cycles)
+        callback.assert_called_once()
+
     def test_delete_cycle_emits_changed(self):
         cycle = Cycle(start_date=date(2025, 12, 20), duration=3)
         callback = MagicMock()
         self.store.connect("changed", callback)
 
         self.store.delete_cycle(cycle)
+        self._flush_idle()
         self.mock_sqlite.delete_cycle.assert_called_once_with(cycle)
         callback.assert_called_once()
 
@@ -56,24 +104,51 @@ class TestDataStore(unittest.TestCase):
         self.store.connect("changed", callback)
 
         self.store.add_pregnancy(preg)
+        self._flush_idle()
         self.mock_sqlite.insert_pregnancy.assert_called_once_with(preg)
         callback.assert_called_once()
 
+    def test_add_pregnancies_emits_changed_once(self):
+        pregnancies = [
+            Pregnancy(start_date=date(2024, 3, 1), confirmed=True),
+            Pregnancy(start_date=date(2025, 12, 20), confirmed=True),
+        ]
+        callback = MagicMock()
+        self.store.connect("changed", callback)
+
+        self.store.add_pregnancies(pregnancies)
+        self._flush_idle()
+        self.mock_sqlite.insert_pregnancies.assert_called_once_with(pregnancies)
+        callback.assert_called_once()
+
     def test_update_pregnancy_emits_changed(self):
         preg = Pregnancy(start_date=date(2025, 12, 20), confirmed=True)
         callback = MagicMock()
         self.store.connect("changed", callback)
 
         self.store.update_pregnancy(preg)
+        self._flush_idle()
         self.mock_sqlite.update_pregnancy.assert_called_once_with(preg)
         callback.assert_called_once()
 
+    def test_update_pregnancy_unchanged_skips_changed(self):
+        preg = Pregnancy(start_date=date(2025, 12, 20), confirmed=True)
+        self.mock_sqlite.update_pregnancy.return_value = False
+        callback = MagicMock()
+        self.store.connect("changed", callback)
+
+        self.store.update_pregnancy(preg)
+        self._flush_idle()
+        self.mock_sqlite.update_pregnancy.assert_called_once_with(preg)
+        callback.assert_not_called()
+
     def test_delete_pregnancy_emits_changed(self):
         preg = Pregnancy(start_date=date(2025, 12, 20), confirmed=True)
         callback = MagicMock()
         self.store.connect("changed", callback)
 
         self.store.delete_pregnancy(preg)
+        self._flush_idle()
         self.mock_sqlite.delete_pregnancy.assert_called_once_with(preg)
         callback.assert_called_once()
 
@@ -97,6 +172,14 @@ class TestDataStore(unittest.TestCase):
         self.assertEqual(pregnancies, [preg1, preg2])
         self.assertEqual(self.store.get_active_pregnancy(), preg2)
 
+    def test_storage_version_is_cached(self):
+        self.assertEqual(self.store._get_storage_version(), 3)
+
+        with patch.object(self.store, "_metadata_path") as metadata_path:
+            self.store._set_storage_version(3)
+            self.assertEqual(self.store._get_storage_version(), 3)
+            metadata_path.assert_not_called()
+
     def test_save_all_is_noop(self):
         # save_all just passes
         self.store.save_all()  # Should not raise
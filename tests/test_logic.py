@@ -1,3 +1,4 @@
+import statistics
 import unittest
 from datetime import date, timedelta
 
@@ -62,6 +63,54 @@ class TestCycleStats(unittest.TestCase):
             stats.predicted_next_period, c1.start_date + timedelta(days=28)
         )
 
+    def test_single_pass_stats_match_statistics_module(self):
+        starts = [date(2025, 1, 1)]
+        for length in [27, 31, 29, 35, 26, 30]:
+            starts.append(starts[-1] + timedelta(days=length))
+        cycles = [Cycle(start_date=d, duration=5) for d in starts]
+        stats = CycleStats(cycles, cycle_len=28, luteal_len=14)
+
+        lengths = [27, 31, 29, 35, 26, 30]
+        self.assertAlmostEqual(stats.average_cycle_length(), statistics.mean(lengths))
+        self.assertAlmostEqual(stats.cycle_length_std_dev(), statistics.stdev(lengths))
+        self.assertEqual(stats.cycle_length_range(), "26-35 days")
+
+    def test_prediction_uses_exact_mean(self):
+        starts = [date(2025, 1, 1)]
+        for length in [25, 26, 21, 21, 28, 27, 34]:
+            starts.append(starts[-1] + timedelta(days=length))
+        cycles = [Cycle(start_date=d, duration=5) for d in starts]
+        stats = CycleStats(cycles, cycle_len=28, luteal_len=14)
+
+        # The mean is exactly 26, so it must not truncate to 25
+        self.assertEqual(stats.average_cycle_length(), 26.0)
+        self.assertEqual(stats.predicted_next_period, date(2025, 7, 28))
+
+    def test_current_phase_for_given_day(self):
+        c = Cycle(start_date=date(2025, 3, 1), duration=5)
+        stats = CycleStats([c], cycle_len=28, luteal_len=14)
+        # Next period 2025-03-29, ovulation predicted on 2025-03-15
+
+        self.assertEqual(stats.get_current_phase(date(2025, 2, 28)), "Unknown")
+        self.assertEqual(stats.get_current_phase(date(2025, 3, 3)), "Menstruation")
+        self.assertTrue(stats.is_ovulating(date(2025, 3, 14)))
+        self.assertEqual(stats.get_current_phase(date(2025, 3, 14)), "Ovulation")
+        self.assertEqual(stats.get_current_phase(date(2025, 3, 20)), "Luteal")
+        self.assertEqual(stats.get_current_phase(date(2025, 3, 29)), "Unknown")
+
+    def test_derived_values_are_memoized(self):
+        c1 = Cycle(start_date=date(2025, 1, 1), duration=5)
+        c2 = Cycle(start_date=date(2025, 1, 31), duration=5)
+        stats = CycleStats([c1, c2], cycle_len=28, luteal_len=14)
+
+        self.assertIs(stats.intervals, stats.intervals)
+        next_period = stats.predicted_next_period
+
+        # Values are computed once per instance, later edits are not seen
+        c2.start_date = date(2025, 2, 10)
+        self.assertEqual(stats.intervals, [30])
+        self.assertIs(stats.predicted_next_period, next_period)
+
 
 if __name__ == "__main__":
     unittest.main()
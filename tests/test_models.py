@@ -1,6 +1,6 @@
 import unittest
 from datetime import date, timedelta
-from src.models import DayEntry, Pregnancy, Cycle
+from src.models import DayEntry, Pregnancy, Cycle, parse_date
 
 
 class TestDayEntry(unittest.TestCase):
@@ -292,5 +292,18 @@ class TestCycle(unittest.TestCase):
         self.assertEqual(len(restored.days), len(original.days))
 
 
+
+class TestParseDate(unittest.TestCase):
+    """Test cases for parsing user-entered dates."""
+
+    def test_parse_date_accepts_year_month_day(self):
+        self.assertEqual(parse_date("2025-01-05"), date(2025, 1, 5))
+        self.assertEqual(parse_date("2025-1-5"), date(2025, 1, 5))
+
+    def test_parse_date_rejects_other_formats(self):
+        for text in ["20250105", "2025-W01-1", "2025-02-30", "", "05/01/2025"]:
+            self.assertIsNone(parse_date(text), text)
+
+
 if __name__ == "__main__":
     unittest.main()
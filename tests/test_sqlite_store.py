@@ -1,3 +1,5 @@
+import sqlite3
+import tempfile
 import unittest
 from datetime import date
 
@@ -32,6 +34,49 @@ class TestSQLiteStore(unittest.TestCase):
         self.assertEqual(c.days[0].mood, "happy")
         self.assertEqual(c.days[1].flow, "medium")
 
+    def test_insert_cycles_bulk(self):
+        cycles = [
+            Cycle(start_date=date(2025, 10, 20), duration=4),
+            Cycle(start_date=date(2025, 11, 18), duration=5),
+        ]
+        self.store.insert_cycles(cycles)
+
+        self.assertTrue(all(c.id is not None for c in cycles))
+        self.assertEqual(len(self.store.get_cycles()), 2)
+
+    def test_insert_cycles_bulk_rolls_back_on_error(self):
+        cycles = [
+            Cycle(start_date=date(2025, 10, 20), duration=4),
+            Cycle(start_date=date(2025, 10, 20), duration=5),
+        ]
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.store.insert_cycles(cycles)
+
+        self.assertEqual(self.store.get_cycles(), [])
+
+    def test_get_cycles_ordered_by_start_date(self):
+        later = Cycle(start_date=date(2025, 12, 20), duration=3)
+        earlier = Cycle(start_date=date(2025, 11, 22), duration=4)
+        self.store.insert_cycle(later)
+        self.store.insert_cycle(earlier)
+
+        starts = [c.start_date for c in self.store.get_cycles()]
+        self.assertEqual(starts, [earlier.start_date, later.start_date])
+        self.assertEqual(self.store.get_active_cycle().start_date, later.start_date)
+
+    def test_get_cycles_groups_days_per_cycle(self):
+        first = Cycle(start_date=date(2025, 11, 22), duration=2)
+        first.generate_days()
+        empty = Cycle(start_date=date(2025, 12, 20), duration=3)
+        self.store.insert_cycles([first, empty])
+
+        cycles = self.store.get_cycles()
+        self.assertEqual(
+            [d.date for d in cycles[0].days],
+            [date(2025, 11, 22), date(2025, 11, 23)],
+        )
+        self.assertEqual(cycles[1].days, [])
+
     def test_update_cycle(self):
         cycle = Cycle(start_date=date(2025, 12, 20), duration=3)
         self.store.insert_cycle(cycle)
@@ -40,6 +85,25 @@ class TestSQLiteStore(unittest.TestCase):
         cycles = self.store.get_cycles()
         self.assertEqual(cycles[0].duration, 5)
 
+    def test_update_cycles_bulk(self):
+        cycles = [
+            Cycle(start_date=date(2025, 10, 20), duration=4),
+            Cycle(start_date=date(2025, 11, 18), duration=5),
+        ]
+        self.store.insert_cycles(cycles)
+        for cycle in cycles:
+            cycle.duration = 2
+            cycle.generate_days()
+        self.store.update_cycles(cycles)
+
+        stored = self.store.get_cycles()
+        self.assertEqual([c.duration for c in stored], [2, 2])
+        self.assertEqual([len(c.days) for c in stored], [2, 2])
+
+    def test_update_cycles_requires_ids(self):
+        with self.assertRaises(ValueError):
+            self.store.update_cycles([Cycle(start_date=date(2025, 10, 20))])
+
     def test_delete_cycle(self):
         cycle = Cycle(start_date=date(2025, 12, 20), duration=3)
         self.store.insert_cycle(cycle)
@@ -55,6 +119,40 @@ class TestSQLiteStore(unittest.TestCase):
         self.assertEqual(pregnancies[0].start_date, preg.start_date)
         self.assertTrue(pregnancies[0].confirmed)
 
+    def test_rows_round_trip_every_field(self):
+        preg = Pregnancy(
+            start_date=date(2025, 3, 1),
+            confirmed=False,
+            end_date=date(2025, 11, 20),
+            notes="note",
+            custom_due_date=date(2025, 12, 1),
+        )
+        self.store.insert_pregnancy(preg)
+        day = DayEntry(
+            date=date(2025, 2, 1),
+            symptoms=["cramps", "headache"],
+            mood="Calm",
+            temperature=36.6,
+            flow="Light",
+            notes="day note",
+        )
+        cycle = Cycle(start_date=date(2025, 2, 1), duration=1, days=[day])
+        cycle.pregnancy = preg
+        self.store.insert_cycle(cycle)
+
+        self.assertEqual(self.store.get_pregnancies(), [preg])
+        stored = self.store.get_cycles()[0]
+        self.assertEqual(stored, cycle)
+        self.assertEqual(stored.pregnancy, preg)
+
+    def test_insert_pregnancies_bulk(self):
+        pregnancies = [
+            Pregnancy(start_date=date(2024, 3, 1), end_date=date(2024, 12, 1)),
+            Pregnancy(start_date=date(2025, 12, 20)),
+        ]
+        self.store.insert_pregnancies(pregnancies)
+        self.assertEqual(len(self.store.get_pregnancies()), 2)
+
     def test_update_pregnancy(self):
         preg = Pregnancy(start_date=date(2025, 12, 20), confirmed=True)
         self.store.insert_pregnancy(preg)
@@ -63,6 +161,15 @@ class TestSQLiteStore(unittest.TestCase):
         pregnancies = self.store.get_pregnancies()
         self.assertFalse(pregnancies[0].confirmed)
 
+    def test_update_pregnancy_reports_unchanged(self):
+        preg = Pregnancy(start_date=date(2025, 12, 20), confirmed=True)
+        self.store.insert_pregnancy(preg)
+
+        self.assertFalse(self.store.update_pregnancy(preg))
+        preg.custom_due_date = date(2026, 9, 20)
+        self.assertTrue(self.store.update_pregnancy(preg))
+        self.assertFalse(self.store.update_pregnancy(preg))
+
     def test_delete_pregnancy(self):
         preg = Pregnancy(start_date=date(2025, 12, 20), confirmed=True)
         self.store.insert_pregnancy(preg)
@@ -98,6 +205,63 @@ class TestSQLiteStore(unittest.TestCase):
         active_preg = self.store.get_active_pregnancy()
         self.assertEqual(active_preg.start_date, preg2.start_date)
 
+    def test_get_active_cycle_loads_days_and_pregnancy(self):
+        self.assertIsNone(self.store.get_active_cycle())
+        self.assertIsNone(self.store.get_active_pregnancy())
+
+        preg = Pregnancy(start_date=date(2025, 12, 21), confirmed=True)
+        self.store.insert_pregnancy(preg)
+        cycle = Cycle(start_date=date(2025, 12, 21), duration=2)
+        cycle.generate_days()
+        cycle.pregnancy = preg
+        self.store.insert_cycle(cycle)
+
+        active = self.store.get_active_cycle()
+        self.assertEqual(len(active.days), 2)
+        self.assertEqual(active.pregnancy.id, preg.id)
+
+    def test_pregnancies_table_is_without_rowid(self):
+        row = self.store.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'pregnancies'"
+        ).fetchone()
+        self.assertIn("WITHOUT ROWID", row["sql"])
+
+    def test_rowid_pregnancies_table_is_migrated(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/luna.db"
+            conn = sqlite3.connect(path)
+            conn.execute(
+                """
+                CREATE TABLE pregnancies (
+                    id TEXT PRIMARY KEY,
+                    start_date TEXT UNIQUE NOT NULL,
+                    confirmed INTEGER NOT NULL,
+                    end_date TEXT,
+                    notes TEXT,
+                    custom_due_date TEXT
+                )
+            """
+            )
+            conn.execute(
+                "INSERT INTO pregnancies VALUES (?, ?, ?, ?, ?, ?)",
+                ("p1", "2025-03-01", 1, None, "x", None),
+            )
+            conn.commit()
+            conn.close()
+
+            store = SQLiteStore(app_id=APP_ID, db_path=path)
+            try:
+                pregnancies = store.get_pregnancies()
+                row = store.conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE name = 'pregnancies'"
+                ).fetchone()
+            finally:
+                store.close()
+
+        self.assertIn("WITHOUT ROWID", row["sql"])
+        self.assertEqual([p.id for p in pregnancies], ["p1"])
+        self.assertEqual(pregnancies[0].notes, "x")
+
 
 if __name__ == "__main__":
     unittest.main()